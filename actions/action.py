@@ -1,52 +1,283 @@
-from typing import Callable, List, TypeVar, Type, Optional, get_type_hints
+from typing import Any, Callable, Tuple, TypeVar, Type, Optional, get_type_hints
 import inspect
-
-from loguru import logger
+import weakref
 
 from .utils import is_compatible_type, type_name, get_real_types
 from .type_safety_level import TypeSafetyLevel
 
 Args = TypeVar('Args')
 
+# Enum members are singletons, so the safety level can be compared with a plain
+# pointer-identity `is` against these module-level aliases instead of going
+# through Enum.__eq__ on every connect/invoke.
+_NONE = TypeSafetyLevel.NONE
+_WARNING = TypeSafetyLevel.WARNING
+_ERROR = TypeSafetyLevel.ERROR
+
+
+_handler_param_types_cache: "weakref.WeakKeyDictionary[Callable[..., None], Tuple[Tuple[str, Type], ...]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _handler_param_types(handler: Callable[..., None]) -> Tuple[Tuple[str, Type], ...]:
+    """
+    Extracts the (name, annotation) pairs for a handler's parameters, memoized per handler.
+
+    `inspect.signature` and `get_type_hints` are expensive, and the same handler is
+    often connected to many actions (or reconnected repeatedly) while its annotations
+    never change. The cache is weak-keyed so it does not keep otherwise-dead handlers
+    alive; callables that cannot be weak-referenced are simply re-introspected.
+
+    Args:
+        handler: The handler whose parameters should be inspected.
+
+    Returns:
+        A tuple of (parameter name, annotation) pairs in declaration order, with
+        `inspect._empty` standing in for missing annotations.
+    """
+    try:
+        cached = _handler_param_types_cache.get(handler)
+    except TypeError:
+        return _introspect_handler_params(handler)
+
+    if cached is not None:
+        return cached
+
+    result = _introspect_handler_params(handler)
+    try:
+        _handler_param_types_cache[handler] = result
+    except TypeError:
+        pass
+
+    return result
+
+
+def _introspect_handler_params(handler: Callable[..., None]) -> Tuple[Tuple[str, Type], ...]:
+    """
+    Uncached introspection behind `_handler_param_types`.
+
+    For plain positional-argument functions the parameter names are read straight off
+    the code object, skipping `inspect.signature` and its per-parameter object
+    construction. Wrapped callables, partials, builtins and signatures with
+    */**/keyword-only parameters go through `inspect.signature` as before.
+
+    Args:
+        handler: The handler whose parameters should be inspected.
+
+    Returns:
+        A tuple of (parameter name, annotation) pairs in declaration order, with
+        `inspect._empty` standing in for missing annotations.
+    """
+    if inspect.isfunction(handler) and not hasattr(handler, '__wrapped__'):
+        code = handler.__code__
+        if not code.co_kwonlyargcount and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+            type_hints = handler.__annotations__
+            if any(type(hint) is str for hint in type_hints.values()):
+                # Stringified annotations (forward refs, `from __future__ import
+                # annotations`) still need the full resolution machinery.
+                type_hints = get_type_hints(handler)
+            else:
+                # get_type_hints normalizes a bare `None` annotation to NoneType
+                # (PEP 484); mirror that when reading __annotations__ raw.
+                type_hints = {name: type(None) if hint is None else hint
+                              for name, hint in type_hints.items()}
+            return tuple((name, type_hints.get(name, inspect._empty))
+                         for name in code.co_varnames[:code.co_argcount])
+
+    signature = inspect.signature(handler)
+    type_hints = get_type_hints(handler)
+
+    return tuple((param.name, type_hints.get(param.name, inspect._empty))
+                 for param in signature.parameters.values())
+
+
+def _build_fast_checker(type_variants: Tuple[Tuple[Type, ...], ...]) -> Optional[Callable[..., bool]]:
+    """
+    Compiles a specialized argument checker for the given type variants.
+
+    The generated function is unrolled for the action's exact arity and types, so
+    each invoke pays only a straight line of `isinstance` calls instead of the
+    generic zip/any loop. Specialization is only possible when every expected type
+    is a plain class (`isinstance`-able); for typing constructs such as `Any` or
+    `Callable[...]` this returns None and the generic check is used instead.
+
+    Args:
+        type_variants: The per-argument tuples of accepted types, as produced by
+                       `get_real_types`.
+
+    Returns:
+        A compiled checker taking the invoke arguments and returning a bool, or
+        None if the types cannot be checked with plain `isinstance`.
+    """
+    # `Any` needs its own screen: it registers as a class on 3.11+ yet isinstance
+    # still rejects it at call time.
+    if any(t is Any or not isinstance(t, type) for variant in type_variants for t in variant):
+        return None
+
+    namespace = {}
+    conditions = []
+
+    for index, variant in enumerate(type_variants):
+        name = f"_t{index}"
+        # Monomorphic arguments get the bare class: isinstance against a single
+        # class is cheaper than against a one-element tuple.
+        namespace[name] = variant[0] if len(variant) == 1 else tuple(variant)
+        conditions.append(f"isinstance(_a{index}, {name})")
+
+    params = ", ".join(f"_a{index}" for index in range(len(type_variants)))
+    body = " and ".join(conditions) or "True"
+    source = f"def _checker({params}):\n    return {body}\n"
+
+    exec(source, namespace)
+    return namespace["_checker"]
+
+
+def _handler_key(handler: Callable[..., None]) -> object:
+    """
+    Derives the registry key for a handler.
+
+    Bound methods are recreated on every attribute access and are stored behind weak
+    references, so they are keyed by (underlying function, receiver id) — stable
+    across accesses and holding no strong reference to the receiver. Any other
+    callable is its own key, except unhashable callables, which are keyed by id —
+    the registry holds them strongly while connected, keeping the id stable; they
+    must be disconnected with the same object, not an equal one.
+
+    Args:
+        handler: The handler being connected or disconnected.
+
+    Returns:
+        A hashable key identifying the handler in the registry.
+    """
+    if inspect.ismethod(handler):
+        return (handler.__func__, id(handler.__self__))
+
+    try:
+        hash(handler)
+    except TypeError:
+        return id(handler)
+
+    return handler
+
+
+def _build_dispatcher(handlers: Tuple[Callable[..., None], ...]) -> Callable[..., None]:
+    """
+    Compiles a straight-line dispatcher for the given handler entries.
+
+    Instead of iterating the handler tuple on every invoke, the calls are unrolled
+    into a generated function that closes over the handlers directly, removing the
+    loop and per-iteration indexing from the dispatch path. `WeakMethod` entries are
+    resolved per call and skipped silently when their receiver has been collected.
+
+    Args:
+        handlers: The handler entries (callables or WeakMethods) in connection order.
+
+    Returns:
+        A function taking the invoke arguments and calling each live handler with them.
+    """
+    namespace = {f"_h{index}": handler for index, handler in enumerate(handlers)}
+
+    lines = []
+    for index, handler in enumerate(handlers):
+        if isinstance(handler, weakref.WeakMethod):
+            lines.append(f"    _m{index} = _h{index}()\n"
+                         f"    if _m{index} is not None:\n"
+                         f"        _m{index}(*args)")
+        else:
+            lines.append(f"    _h{index}(*args)")
+
+    calls = "\n".join(lines) or "    pass"
+    source = f"def _dispatcher(*args):\n{calls}\n"
+
+    exec(source, namespace)
+    return namespace["_dispatcher"]
+
 class Action:
     """
     Represents an action that can connect handlers and invoke them with specified argument types.
     Handlers are validated to ensure their argument types match the expected types when connected or invoked.
     """
-    def __init__(self, *arg_types: Type) -> None:
+
+    # Slotted: apps declare many long-lived Actions, and dropping the per-instance
+    # __dict__ shrinks each one considerably while making attribute loads direct
+    # slot reads. `connect` and `invoke` are slots (not methods) because each
+    # instance binds its checked or unchecked variant at construction.
+    __slots__ = ("_type_variants", "_arity", "_check_invoke_types_fast",
+                 "_handlers", "_dispatch", "_verified", "_type_safety",
+                 "connect", "invoke", "__weakref__")
+
+    def __init__(self, *arg_types: Type, type_safety: TypeSafetyLevel = TypeSafetyLevel.ERROR) -> None:
         """
         Initializes the Action with the expected argument types for handlers.
 
         Args:
             arg_types: One or more types that specify the expected argument types for any connected
                        handler.
+            type_safety (TypeSafetyLevel, optional): The default level of type safety enforcement
+                                                      for connect/invoke calls that do not specify
+                                                      one. Defaults to TypeSafetyLevel.ERROR.
         """
-        self._type_variants = get_real_types(*arg_types)
-
-        self._handlers: List[Callable[..., None]] = []
-
-    def connect(self, handler: Callable[..., None], type_safety: TypeSafetyLevel = TypeSafetyLevel.ERROR) -> None:
+        # Frozen as a tuple of tuples: the table is built exactly once and every
+        # later read (checker codegen, diagnostics) iterates immutable storage.
+        self._type_variants = tuple(get_real_types(*arg_types))
+        self._arity = len(self._type_variants)
+        self._check_invoke_types_fast = _build_fast_checker(self._type_variants)
+
+        # Insertion-ordered dict mapping handler key -> dispatch entry (the callable
+        # itself, or a WeakMethod for bound methods): membership, duplicate detection
+        # and disconnect are O(1) instead of scanning, while iteration order still
+        # matches connection order. Dispatch itself runs through the compiled
+        # snapshot below, so mutating this during an invoke is safe.
+        self._handlers: "dict[object, Callable[..., None]]" = {}
+
+        # The compiled dispatcher for the current handler tuple, built lazily on
+        # first invoke and invalidated whenever the handlers change.
+        self._dispatch: Optional[Callable[..., None]] = None
+
+        # Handlers that already passed validation: a view that disconnects and
+        # reconnects the same handler should not pay the signature check twice.
+        # Weak references keep this from prolonging handler lifetimes.
+        self._verified: "weakref.WeakSet[Callable[..., None]]" = weakref.WeakSet()
+
+        self._type_safety = type_safety
+        if type_safety is _NONE:
+            # Checks are permanently off: bind the bare fast paths so invoke/connect
+            # skip even the type-safety branch.
+            self.connect = self._connect_unchecked
+            self.invoke = self._invoke_unchecked
+        else:
+            self.connect = self._connect_checked
+            self.invoke = self._invoke_checked
+
+    def _connect_checked(self, handler: Callable[..., None], type_safety: Optional[TypeSafetyLevel] = None) -> None:
         """
         Connects a handler (callback) to the action and validates its signature against the expected argument types.
 
+        Connecting a handler that is already connected is a no-op. Bound methods are
+        held through weak references, so a connected method does not keep its receiver
+        alive; once the receiver is collected the handler is dropped automatically.
+
         Args:
             handler: A callable to be connected to the action. It should match the expected argument types.
             type_safety (TypeSafetyLevel, optional): The level of type safety enforcement. Defaults
-                                                      to TypeSafetyLevel.ERROR.
+                                                      to the action's configured level.
 
         Raises:
             TypeError: If the handler's signature does not match the expected argument types.
             (if type safety level is ERROR)
         """
+        if type_safety is None:
+            type_safety = self._type_safety
 
-        if type_safety != TypeSafetyLevel.NONE:
-            types_compatible: bool
-            error: TypeError
-            types_compatible, error= self._check_connect_types(handler)
+        if type_safety is not _NONE and handler not in self._verified:
+            if self._check_connect_types(handler, type_safety):
+                try:
+                    self._verified.add(handler)
+                except TypeError:
+                    # Not weak-referenceable; it simply gets re-checked on reconnect.
+                    pass
 
-            self._process_type_check_result(types_compatible, type_safety, error)
-
-        self._handlers.append(handler)
+        self._register(handler)
 
     def disconnect(self, handler: Callable[..., None]) -> None:
         """
@@ -59,117 +290,201 @@ class Action:
             ValueError: If the handler is not connected to the action.
         """
         try:
-            self._handlers.remove(handler)
-        except ValueError:
+            del self._handlers[_handler_key(handler)]
+        except KeyError:
             raise ValueError("Can't disconnect handler: handler is not connected..")
 
+        self._dispatch = None
+
+    def _register(self, handler: Callable[..., None]) -> None:
+        """
+        Adds a handler to the registry, wrapping bound methods in a WeakMethod.
+
+        A dead receiver triggers the weak reference callback, which prunes the entry
+        and invalidates the compiled dispatcher.
+
+        Args:
+            handler: A callable to register. Already-registered handlers are ignored.
+        """
+        key = _handler_key(handler)
+        if key in self._handlers:
+            return
+
+        if inspect.ismethod(handler):
+            def _prune(ref, _self=self, _key=key):
+                _self._handlers.pop(_key, None)
+                _self._dispatch = None
+
+            entry = weakref.WeakMethod(handler, _prune)
+        else:
+            entry = handler
+
+        self._handlers[key] = entry
+        self._dispatch = None
+
 
-    def invoke(self, *args: Args, type_safety: TypeSafetyLevel = TypeSafetyLevel.ERROR) -> None:
+    def _invoke_checked(self, *args: Args, type_safety: Optional[TypeSafetyLevel] = None) -> None:
         """
         Invokes all connected handlers with the provided arguments, ensuring type validation before calling.
 
         Args:
             args: Arguments to pass to the connected handlers. These must match the expected types.
             type_safety (TypeSafetyLevel, optional): The level of type safety enforcement. Defaults
-                                                      to TypeSafetyLevel.ERROR.
+                                                      to the action's configured level.
 
         Raises:
             TypeError: If the arguments passed do not match the expected types.
         """
-        if type_safety != TypeSafetyLevel.NONE:
-            types_compatible: bool
-            error: TypeError
-            types_compatible, error= self._check_invoke_types(*args)
+        if type_safety is None:
+            type_safety = self._type_safety
 
-            self._process_type_check_result(types_compatible, type_safety, error)
+        if type_safety is not _NONE:
+            self._check_invoke_types(*args, type_safety=type_safety)
 
-        for handler in self._handlers:
-            handler(*args)
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = _build_dispatcher(tuple(self._handlers.values()))
 
-    def _check_connect_types(self, handler: Callable[..., None]) -> (bool, Optional[TypeError]):
+        dispatch(*args)
+
+    def _connect_unchecked(self, handler: Callable[..., None],
+                           type_safety: Optional[TypeSafetyLevel] = None) -> None:
+        """
+        Fast-path connect for actions constructed with TypeSafetyLevel.NONE.
+
+        Args:
+            handler: A callable to be connected to the action.
+            type_safety (TypeSafetyLevel, optional): An explicit per-call level re-enables the
+                                                      checked path.
+        """
+        if type_safety is not None and type_safety is not _NONE:
+            self._connect_checked(handler, type_safety)
+            return
+
+        self._register(handler)
+
+    def _invoke_unchecked(self, *args: Args, type_safety: Optional[TypeSafetyLevel] = None) -> None:
+        """
+        Fast-path invoke for actions constructed with TypeSafetyLevel.NONE.
+
+        Args:
+            args: Arguments to pass to the connected handlers.
+            type_safety (TypeSafetyLevel, optional): An explicit per-call level re-enables the
+                                                      checked path.
+        """
+        if type_safety is not None and type_safety is not _NONE:
+            self._invoke_checked(*args, type_safety=type_safety)
+            return
+
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = _build_dispatcher(tuple(self._handlers.values()))
+
+        dispatch(*args)
+
+    def _check_connect_types(self, handler: Callable[..., None], type_safety: TypeSafetyLevel) -> bool:
         """
         Validates that the handler's parameter type annotations match the expected types.
 
+        A mismatch is raised or logged according to the given type safety level.
+
         Args:
             handler: The handler function whose signature will be checked.
+            type_safety: A TypeSafetyLevel deciding whether a mismatch raises or warns.
 
         Returns:
-            A tuple where the first element is a boolean indicating whether the types are compatible,
-            and the second element is an optional TypeError describing the mismatch if one is found.
+            True if the handler passed validation, False if a mismatch was only warned about.
+
+        Raises:
+            TypeError: If the handler's signature does not match and type safety is ERROR.
         """
         if not callable(handler):
-            return False, TypeError("Connected handler must be a callable.")
-
-        signature = inspect.signature(handler)
-        type_hints = get_type_hints(handler)
-        handler_params = {param.name: type_hints.get(param.name, inspect._empty)
-                          for param in signature.parameters.values()}
+            self._raise_or_warn(TypeError("Connected handler must be a callable."), type_safety)
+            return False
 
-        param_names = list(handler_params.keys())
-        param_types = list(handler_params.values())
+        handler_params = _handler_param_types(handler)
 
-        if len(handler_params) != len(self._type_variants):
-            return False, TypeError(f"Handler argument count mismatch. "
-                                    f"Expected {len(self._type_variants)}, got {len(handler_params)}.")
+        if len(handler_params) != self._arity:
+            self._raise_or_warn(TypeError(f"Handler argument count mismatch. "
+                                          f"Expected {self._arity}, got {len(handler_params)}."),
+                                type_safety)
+            return False
 
-        for param_name, handler_type, expected_types in zip(param_names, param_types, self._type_variants):
+        for (param_name, handler_type), expected_types in zip(handler_params, self._type_variants):
             if handler_type is inspect._empty:
-                return False, TypeError(f"Parameter ('{param_name}') of action handler has no type annotation.")
+                self._raise_or_warn(TypeError(f"Parameter ('{param_name}') of action handler has no type annotation."),
+                                    type_safety)
+                return False
             if not is_compatible_type(handler_type, expected_types):
-                return False, TypeError(f"Handler argument type mismatch. "
-                                        f"Expected '{type_name(expected_types)}', got '{type_name(handler_type)}'.")
+                self._raise_or_warn(TypeError(f"Handler argument type mismatch. "
+                                              f"Expected '{type_name(expected_types)}', got '{type_name(handler_type)}'."),
+                                    type_safety)
+                return False
 
-        return True, None
+        return True
 
-    def _check_invoke_types(self, *args: Args) -> (bool, Optional[TypeError]):
+    def _check_invoke_types(self, *args: Args, type_safety: TypeSafetyLevel) -> None:
         """
         Validates that the types of the arguments passed to the action match the expected types.
 
+        On success nothing is allocated or returned; a mismatch is raised or logged
+        according to the given type safety level.
+
         Args:
             args: The arguments provided when invoking the action.
+            type_safety: A TypeSafetyLevel deciding whether a mismatch raises or warns.
 
-        Returns:
-            A tuple where the first element is a boolean indicating whether the argument types are compatible,
-            and the second element is an optional TypeError describing the mismatch if one is found.
+        Raises:
+            TypeError: If the arguments do not match and type safety is ERROR.
         """
-        if len(args) != len(self._type_variants):
-            return False, TypeError(
-                f"Call argument count mismatch. Expected {len(self._type_variants)}, got {len(args)}."
-            )
+        if len(args) != self._arity:
+            self._raise_or_warn(TypeError(f"Call argument count mismatch. "
+                                          f"Expected {self._arity}, got {len(args)}."),
+                                type_safety)
+            return
 
-        for arg, expected_types in zip(args, self._type_variants):
-            if not any(isinstance(arg, t) for t in expected_types):
-                return False, TypeError(
-                    f"Call argument type mismatch. Expected '{type_name(expected_types)}',"
-                    f" got '{type_name(type(arg))}'."
-                )
+        if self._check_invoke_types_fast is not None:
+            if self._check_invoke_types_fast(*args):
+                return
+        elif all(map(isinstance, args, self._type_variants)):
+            # map/all run the whole pass in C; the Python-level loop below only
+            # runs on failure, to locate the mismatch and build the message.
+            return
 
-        return True, None
+        # Invariant: no error object or message formatting may be constructed above
+        # this point on the success path — TypeErrors are only ever built once a
+        # mismatch is established.
+        for arg, expected_types in zip(args, self._type_variants):
+            if not isinstance(arg, expected_types):
+                self._raise_or_warn(TypeError(f"Call argument type mismatch. Expected '{type_name(expected_types)}',"
+                                              f" got '{type_name(type(arg))}'."),
+                                    type_safety)
+                return
 
-    def _process_type_check_result(self, types_compatible: bool, type_safety: TypeSafetyLevel, error: TypeError) -> None:
+    def _raise_or_warn(self, error: TypeError, type_safety: TypeSafetyLevel) -> None:
         """
-        Processes the result of a type check by either logging a warning or raising an error,
-        depending on the configured type safety level.
+        Raises or logs a type check failure, depending on the given type safety level.
 
         Args:
-            types_compatible: A boolean indicating if the type check passed.
+            error: The TypeError to raise or log.
             type_safety: A TypeSafetyLevel indicating type check importance
-            error: The TypeError to raise or log if the type check fails.
 
         Raises:
-            TypeError: If type safety is set to ERROR and the type check fails.
+            TypeError: If type safety is set to ERROR.
         """
-        if types_compatible:
-            return
-
-        if type_safety == TypeSafetyLevel.NONE:
+        if type_safety is _NONE:
             return
 
-        if type_safety == TypeSafetyLevel.WARNING:
-            logger.warning(str(error))
+        if type_safety is _WARNING:
+            # Imported lazily: loguru is only needed once a warning actually fires,
+            # and pulling it in at import time slows cold start for everyone else.
+            from loguru import logger
+            # lazy=True defers stringifying the error (which interpolates type
+            # names) until a sink at WARNING level actually accepts the record.
+            logger.opt(lazy=True).warning("{}", lambda: str(error))
             return
 
-        if type_safety == TypeSafetyLevel.ERROR:
+        if type_safety is _ERROR:
             raise error
 
-        raise ValueError(f"_process_type_check_result invoked with unknown {type_safety=}")
+        raise ValueError(f"_raise_or_warn invoked with unknown {type_safety=}")
@@ -1,4 +1,5 @@
-from typing import Any, Union, Type, Tuple, TypeVar, Callable, Annotated, get_args, get_origin
+from functools import lru_cache
+from typing import Any, Optional, Union, Type, Tuple, TypeVar, Callable, Annotated, get_args, get_origin
 from collections.abc import Callable as abc_Callable
 
 
@@ -9,6 +10,11 @@ def is_compatible_type(type_a: Type[Any], valid_types: Tuple[Type[Any], ...]) ->
     This function verifies if the concrete type `type_a` is acceptable when any of the expected types
     in `valid_types` is provided.
 
+    The check is pure, so results are memoized: the same (type, expected types) queries recur
+    both across connects and within the recursive Union/Callable sub-checks. Unhashable
+    annotations fall back to the uncached check. Call `is_compatible_type.cache_clear()` to
+    reset the cache in long-lived processes.
+
     Args:
         type_a (Type[Any]): A concrete type (typically from a handler’s signature).
         valid_types (Tuple[Type[Any], ...]): A tuple of type annotations representing the acceptable types.
@@ -17,48 +23,92 @@ def is_compatible_type(type_a: Type[Any], valid_types: Tuple[Type[Any], ...]) ->
     Returns:
         bool: True if `type_a` is compatible with at least one of the types in `valid_types`, otherwise False.
     """
-    for expected_type in valid_types:
-        if expected_type is Any:
-            return True
+    try:
+        return _is_compatible_type_cached(type_a, valid_types)
+    except TypeError:
+        return _is_compatible_type_impl(type_a, valid_types)
 
-        type_a_origin = get_origin(type_a)
-        expected_origin = get_origin(expected_type)
-        expected_args = get_args(expected_type)
 
-        callable_types = [Callable, abc_Callable]
+@lru_cache(maxsize=4096)
+def _is_compatible_type_cached(type_a: Type[Any], valid_types: Tuple[Type[Any], ...]) -> bool:
+    return _is_compatible_type_impl(type_a, valid_types)
 
-        if expected_origin is Union:
-            if any(is_compatible_type(type_a, (arg,)) for arg in expected_args):
-                return True
 
-        elif expected_origin in callable_types and type_a_origin in callable_types:
-            callable_args = expected_args[0]
-            expected_return_type = expected_args[1]
+is_compatible_type.cache_clear = _is_compatible_type_cached.cache_clear
+
+
+def _handle_union(type_a: Type[Any], expected_args: Tuple[Type[Any], ...], stack: list) -> Optional[bool]:
+    stack.extend(reversed(expected_args))
+    return None
+
+
+def _handle_annotated(type_a: Type[Any], expected_args: Tuple[Type[Any], ...], stack: list) -> Optional[bool]:
+    stack.append(expected_args[0])
+    return None
+
+
+def _handle_callable(type_a: Type[Any], expected_args: Tuple[Type[Any], ...], stack: list) -> Optional[bool]:
+    if get_origin(type_a) not in (Callable, abc_Callable):
+        return None
+
+    callable_args = expected_args[0]
+    expected_return_type = expected_args[1]
+
+    type_a_args = get_args(type_a)
+
+    actual_args = type_a_args[0] if hasattr(type_a, '__args__') else ()
+    actual_return_type = type_a_args[1] if hasattr(type_a, '__args__') else Any
+
+    if callable_args is Ellipsis or actual_args is Ellipsis:
+        return is_compatible_type(actual_return_type, (expected_return_type,))
+
+    if len(callable_args) == len(actual_args):
+        if all(is_compatible_type(arg_a, (arg_b,))
+               for arg_a, arg_b
+               in zip(actual_args, callable_args)):
+            return is_compatible_type(actual_return_type, (expected_return_type,))
+    return False
+
 
-            type_a_args = get_args(type_a)
+# Structured typing forms dispatch through this table on their origin: one dict
+# lookup replaces the identity chain the old if/elif ladder walked per expected
+# type. A handler returns True/False to settle the whole query, or None to keep
+# scanning (possibly after pushing sub-types onto the worklist).
+_ORIGIN_HANDLERS = {
+    Union: _handle_union,
+    Annotated: _handle_annotated,
+    Callable: _handle_callable,
+    abc_Callable: _handle_callable,
+}
 
-            actual_args = type_a_args[0] if hasattr(type_a, '__args__') else ()
-            actual_return_type = type_a_args[1] if hasattr(type_a, '__args__') else Any
 
-            if callable_args is Ellipsis or actual_args is Ellipsis:
-                return is_compatible_type(actual_return_type, (expected_return_type,))
+def _is_compatible_type_impl(type_a: Type[Any], valid_types: Tuple[Type[Any], ...]) -> bool:
+    # The "does any expected type accept type_a" search is run with an explicit
+    # worklist instead of recursion: Union members and Annotated bases are pushed
+    # onto the stack, so arbitrarily nested unions cost no Python frames. Only the
+    # conjunctive sub-checks (Callable/generic arguments) still recurse.
+    type_a_origin = get_origin(type_a)
+    stack = list(reversed(valid_types))
 
-            if len(callable_args) == len(actual_args):
-                if all(is_compatible_type(arg_a, (arg_b,))
-                       for arg_a, arg_b
-                       in zip(actual_args, callable_args)):
-                    return is_compatible_type(actual_return_type, (expected_return_type,))
-            return False
+    while stack:
+        expected_type = stack.pop()
+
+        if expected_type is Any:
+            return True
+
+        expected_origin = get_origin(expected_type)
+        expected_args = get_args(expected_type)
+
+        handler = _ORIGIN_HANDLERS.get(expected_origin)
+        if handler is not None:
+            outcome = handler(type_a, expected_args, stack)
+            if outcome is not None:
+                return outcome
 
         elif expected_origin is not None and type_a_origin is expected_origin:
             if all(is_compatible_type(type_a, (arg,)) for arg in expected_args):
                 return True
 
-        elif expected_origin is Annotated:
-            base_type = get_args(expected_type)[0]
-            if is_compatible_type(type_a, (base_type,)):
-                return True
-
         elif isinstance(expected_type, TypeVar):
             if type_a == expected_type.__bound__:
                 return True
@@ -128,11 +178,45 @@ def get_real_types(*arg_types: Type) -> list[Tuple[Type, ...]]:
     result = []
 
     for expected_type in arg_types:
-        types = tuple(t for t in get_args(expected_type) if not isinstance(t, TypeVar))
-
-        if not types:
-            types = (expected_type,)
+        if type(expected_type) is type:
+            # Plain classes carry no type arguments; skip the typing-module machinery.
+            # (isinstance(..., type) would also match builtin generic aliases on 3.9/3.10.)
+            result.append((expected_type,))
+            continue
+
+        if get_origin(expected_type) is None:
+            # Unparameterized hints (ABCs, NewTypes, bare aliases) have no arguments
+            # either; only true generics need the full extraction below.
+            result.append((expected_type,))
+            continue
+
+        try:
+            types = _concretize(expected_type)
+        except TypeError:
+            # Unhashable type hint; extract without the cache.
+            types = tuple(t for t in get_args(expected_type) if not isinstance(t, TypeVar)) \
+                    or (expected_type,)
 
         result.append(types)
 
-    return result
\ No newline at end of file
+    return result
+
+
+@lru_cache(maxsize=None)
+def _concretize(expected_type: Type) -> Tuple[Type, ...]:
+    """
+    Extracts the concrete (non-TypeVar) type arguments of a single type hint, memoized.
+
+    The same parametrizations recur across Action declarations, so the get_args
+    walk and TypeVar filtering are only ever paid once per distinct type hint.
+
+    Args:
+        expected_type (Type): A type hint, typically a parameterized generic.
+
+    Returns:
+        Tuple[Type, ...]: The concrete type arguments, or the hint itself as a
+                          singleton tuple when it has none.
+    """
+    types = tuple(t for t in get_args(expected_type) if not isinstance(t, TypeVar))
+
+    return types or (expected_type,)
\ No newline at end of file
@@ -1,4 +1,7 @@
+import gc
 import unittest
+import weakref
+
 from actions import Action, TypeSafetyLevel
 
 class TestAction(unittest.TestCase):
@@ -54,6 +57,37 @@ class TestAction(unittest.TestCase):
         self.assertIn("Call argument type mismatch", str(context.exception))
         self.assertFalse(called, "Handler should not be called when type check fails.")
 
+    def test_none_annotation_is_normalized(self):
+        """Test that a bare `None` annotation is treated as NoneType (PEP 484) when connecting."""
+        from typing import Optional
+        action = Action(Optional[int])
+        results = []
+
+        def handler(a: None) -> None:
+            results.append(a)
+
+        action.connect(handler)
+        action.invoke(None)
+
+        self.assertEqual(results, [None])
+
+    def test_duplicate_connect_is_noop(self):
+        """Test that connecting an already-connected handler is a no-op and it fires only once."""
+        action = Action(int)
+        results = []
+
+        def handler(a: int) -> None:
+            results.append(a)
+
+        action.connect(handler)
+        action.connect(handler)
+        action.invoke(42)
+
+        self.assertEqual(results, [42], "Handler should fire once despite duplicate connects.")
+
+        action.disconnect(handler)
+        self.assertNotIn(handler, action._handlers)
+
     def test_disconnect_handler(self):
         """Test disconnecting a handler and that disconnecting a non-connected handler raises ValueError."""
         action = Action(int)
@@ -105,6 +139,69 @@ class TestAction(unittest.TestCase):
 
         self.assertEqual(results, ["wrong type"])
 
+    def test_bound_method_handler_does_not_keep_receiver_alive(self):
+        """Test that a connected bound method is held weakly and dropped when its receiver dies."""
+        action = Action(int)
+        results = []
+
+        class Receiver:
+            def on_value(self, a: int) -> None:
+                results.append(a)
+
+        receiver = Receiver()
+        action.connect(receiver.on_value)
+        action.invoke(1)
+        self.assertEqual(results, [1])
+
+        receiver_ref = weakref.ref(receiver)
+        del receiver
+        gc.collect()
+
+        self.assertIsNone(receiver_ref(), "Action should not keep the receiver alive.")
+
+        action.invoke(2)
+        self.assertEqual(results, [1], "Handler of a dead receiver should not be called.")
+
+    def test_unhashable_handler_none_mode(self):
+        """Test that an unhashable callable can be connected, invoked and disconnected in NONE mode."""
+        action = Action(int, type_safety=TypeSafetyLevel.NONE)
+        results = []
+
+        class Handler:
+            def __eq__(self, other):
+                return self is other
+
+            __hash__ = None
+
+            def __call__(self, a) -> None:
+                results.append(a)
+
+        handler = Handler()
+        action.connect(handler)
+        action.invoke(1)
+
+        self.assertEqual(results, [1])
+
+        action.disconnect(handler)
+        action.invoke(2)
+        self.assertEqual(results, [1])
+
+    def test_construction_time_none_mode(self):
+        """Test that an Action constructed with TypeSafetyLevel.NONE skips all checks by default."""
+        action = Action(int, type_safety=TypeSafetyLevel.NONE)
+        results = []
+
+        def handler(a) -> None:
+            results.append(a)
+
+        action.connect(handler)
+        action.invoke("anything")
+
+        self.assertEqual(results, ["anything"])
+
+        with self.assertRaises(TypeError):
+            action.invoke("anything", type_safety=TypeSafetyLevel.ERROR)
+
     def test_none_mode_allows_mismatch(self):
         """Test that in NONE mode, type checks are skipped and any handler/arguments are accepted."""
         action = Action(int)